@@ -0,0 +1,168 @@
+/*
+ * NeuroShell Python Interface - key=value parser extension
+ *
+ * Parses the key=value attributes exported under /sys/kernel/neuroshell/
+ * straight from the raw bytes returned by read(), without decoding the
+ * whole buffer first. neuroshell.py falls back to its pure Python parser
+ * when this extension is not built.
+ *
+ * Build with: make python-ext
+ *
+ * Copyright (C) 2026 HejHdiss
+ * Licensed under GPL v3
+ */
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+#include <string.h>
+
+/* Values with more digits than this may overflow a long long */
+#define MAX_FAST_DIGITS 18
+
+/* Same set as bytes.strip() */
+static int is_space(char c)
+{
+    return c == ' ' || c == '\t' || c == '\n' ||
+           c == '\r' || c == '\v' || c == '\f';
+}
+
+/**
+ * strip - Trim ASCII whitespace from both ends of [*start, *end)
+ */
+static void strip(const char **start, const char **end)
+{
+    while (*start < *end && is_space(**start))
+        (*start)++;
+    while (*end > *start && is_space(*(*end - 1)))
+        (*end)--;
+}
+
+/**
+ * is_int - Check for an optional '-' followed by at least one ASCII digit
+ */
+static int is_int(const char *p, Py_ssize_t len)
+{
+    Py_ssize_t i = (len > 0 && p[0] == '-') ? 1 : 0;
+
+    if (i == len)
+        return 0;
+    for (; i < len; i++) {
+        if (p[i] < '0' || p[i] > '9')
+            return 0;
+    }
+    return 1;
+}
+
+/**
+ * make_value - Convert a stripped value to int if it is a plain decimal
+ */
+static PyObject *make_value(const char *p, Py_ssize_t len)
+{
+    PyObject *text, *value;
+    long long n = 0;
+    Py_ssize_t i;
+    int neg;
+
+    if (!is_int(p, len))
+        return PyUnicode_DecodeUTF8(p, len, "replace");
+
+    neg = p[0] == '-';
+    if (len - neg <= MAX_FAST_DIGITS) {
+        for (i = neg; i < len; i++)
+            n = n * 10 + (p[i] - '0');
+        return PyLong_FromLongLong(neg ? -n : n);
+    }
+
+    /* Arbitrary precision, like int() */
+    text = PyUnicode_DecodeASCII(p, len, NULL);
+    if (!text)
+        return NULL;
+    value = PyLong_FromUnicodeObject(text, 10);
+    Py_DECREF(text);
+    return value;
+}
+
+/**
+ * parse_kv - Parse "key=value" lines from a bytes object into a dict
+ *
+ * Lines without '=' or starting with '=' are skipped, keys and values are
+ * stripped, and later duplicates overwrite earlier ones.
+ */
+static PyObject *parse_kv(PyObject *self, PyObject *args)
+{
+    const char *buf, *line, *next, *end, *eol, *eq;
+    const char *key, *key_end, *val, *val_end;
+    PyObject *result, *k, *v;
+    Py_ssize_t len;
+
+    if (!PyArg_ParseTuple(args, "y#:parse_kv", &buf, &len))
+        return NULL;
+
+    result = PyDict_New();
+    if (!result)
+        return NULL;
+
+    end = buf + len;
+    for (line = buf; line < end; line = next) {
+        eol = memchr(line, '\n', end - line);
+        if (!eol)
+            eol = end;
+        next = eol < end ? eol + 1 : end;
+
+        eq = memchr(line, '=', eol - line);
+        if (!eq || eq == line)
+            continue;
+
+        key = line;
+        key_end = eq;
+        strip(&key, &key_end);
+        val = eq + 1;
+        val_end = eol;
+        strip(&val, &val_end);
+
+        k = PyUnicode_DecodeUTF8(key, key_end - key, "replace");
+        if (!k)
+            goto error;
+        PyUnicode_InternInPlace(&k);
+
+        v = make_value(val, val_end - val);
+        if (!v) {
+            Py_DECREF(k);
+            goto error;
+        }
+
+        if (PyDict_SetItem(result, k, v) < 0) {
+            Py_DECREF(k);
+            Py_DECREF(v);
+            goto error;
+        }
+        Py_DECREF(k);
+        Py_DECREF(v);
+    }
+
+    return result;
+
+error:
+    Py_DECREF(result);
+    return NULL;
+}
+
+static PyMethodDef parser_methods[] = {
+    {"parse_kv", parse_kv, METH_VARARGS,
+     "parse_kv(content: bytes) -> dict\n\n"
+     "Parse key=value lines, converting plain decimal values to int."},
+    {NULL, NULL, 0, NULL}
+};
+
+static struct PyModuleDef parser_module = {
+    PyModuleDef_HEAD_INIT,
+    "_neuroshell_parser",
+    "C implementation of the NeuroShell key=value parser",
+    -1,
+    parser_methods
+};
+
+PyMODINIT_FUNC PyInit__neuroshell_parser(void)
+{
+    return PyModule_Create(&parser_module);
+}
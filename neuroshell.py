@@ -5,27 +5,169 @@ A utility for querying system hardware information via NeuroShell kernel module
 """
 
 import os
+import re
+import errno
 import json
+import math
 import sys
-from pathlib import Path
-from typing import Dict, Optional, Any
+import time
+import weakref
+import signal
+import functools
+import threading
+from typing import TYPE_CHECKING, Dict, Iterable, Optional, Any, Tuple, Union
 
-NEUROSHELL_PATH = Path("/sys/kernel/neuroshell")
+if TYPE_CHECKING:
+    from concurrent.futures import ThreadPoolExecutor
+
+NEUROSHELL_PATH = "/sys/kernel/neuroshell"
+
+# sysfs attributes backing each information category
+CATEGORY_ATTRS = {
+    'cpu': ('cpu_total', 'cpu_info', 'cpu_topology'),
+    'memory': ('mem_info',),
+    'numa': ('numa_nodes', 'numa_info'),
+    'gpu': ('gpu_info', 'gpu_details'),
+    'accelerator': ('accelerator_count', 'accelerator_details'),
+}
+
+# Raw attribute contents keyed by attribute name
+AttrMap = Dict[str, Optional[bytes]]
+
+# sysfs attributes never exceed one kernel page, which is not always 4 KiB
+# (16K/64K pages on some arm64 and ppc64le kernels)
+ATTR_READ_SIZE = os.sysconf('SC_PAGE_SIZE')
+
+# Threads used to overlap the blocking reads of a batch; a few are
+# enough to keep one slow driver read from stalling the rest
+READ_WORKERS = 4
+
+# One key=value pair per line
+_KV_RE = re.compile(rb'^([^=\n]+)=([^\n]*)', re.M)
+
+def _text(raw: bytes) -> str:
+    """Decode raw attribute content"""
+    return raw.decode('utf-8', 'replace')
+
+def _maybe_int(value: bytes) -> Union[int, str]:
+    """Convert value to int if it is a plain decimal, else decode it"""
+    # Check digits up front rather than paying for a ValueError on
+    # every string value
+    digits = value[1:] if value[:1] == b'-' else value
+    return int(value) if digits.isdigit() else _text(value)
+
+def _parse_kv_py(content: bytes) -> Dict[str, Any]:
+    """Parse key=value content into a dict"""
+    return {
+        _text(m.group(1).strip()): _maybe_int(m.group(2).strip())
+        for m in _KV_RE.finditer(content)
+    }
+
+# Prefer the C parser when it has been built (make python-ext)
+_parse_kv = _parse_kv_py
+try:
+    from _neuroshell_parser import parse_kv as _parse_kv
+except ImportError:
+    pass
+
+@functools.lru_cache(maxsize=64)
+def _parse_key_value(content: bytes) -> Tuple[Tuple[str, Any], ...]:
+    """Parse key=value content, memoized on the raw content"""
+    return tuple(_parse_kv(content).items())
 
 class NeuroShellError(Exception):
     """Exception raised when NeuroShell module is not available"""
     pass
 
+class _Handles:
+    """File descriptors and read pool owned by a NeuroShell instance"""
+    
+    def __init__(self, dirfd: int):
+        self.dirfd = dirfd
+        self.fds: Dict[str, int] = {}
+        self.pool: Optional['ThreadPoolExecutor'] = None
+    
+    def close(self) -> None:
+        """Shut down the read pool and close every held fd"""
+        if self.pool is not None:
+            # Never wait here: this may run from a pool thread during GC
+            self.pool.shutdown(wait=False)
+            self.pool = None
+        for fd in self.fds.values():
+            os.close(fd)
+        self.fds.clear()
+        if self.dirfd >= 0:
+            os.close(self.dirfd)
+            self.dirfd = -1
+
 class NeuroShell:
-    """Interface to NeuroShell kernel module"""
+    """
+    Interface to NeuroShell kernel module
+    
+    Holds open fds and a read pool; call close() or use it as a context
+    manager to release them before the instance is garbage collected.
+    """
     
     def __init__(self):
         """Initialize NeuroShell interface"""
-        if not NEUROSHELL_PATH.exists():
+        try:
+            # Attributes are opened relative to this fd for the
+            # lifetime of the instance
+            dirfd = os.open(NEUROSHELL_PATH, os.O_RDONLY | os.O_DIRECTORY)
+        except FileNotFoundError:
             raise NeuroShellError(
                 "NeuroShell module not loaded. "
                 "Please run 'sudo insmod neuroshell_enhanced.ko' first."
-            )
+            ) from None
+        
+        # The handles are released by close(), on garbage collection or at
+        # exit, whichever comes first
+        self._handles = _Handles(dirfd)
+        self._finalizer = weakref.finalize(self, self._handles.close)
+        
+        # Known attributes stay open so each read is a single preadv;
+        # sysfs regenerates the content on every read from offset 0
+        self._fds_lock = threading.Lock()
+        for names in CATEGORY_ATTRS.values():
+            for name in names:
+                try:
+                    self._handles.fds[name] = self._open_attr(name)
+                except OSError:
+                    # Reported when the attribute is actually read
+                    pass
+        
+        # Attribute contents are read at most once per instance unless
+        # disabled with NEUROSHELL_CACHE=0
+        self._use_cache = os.environ.get('NEUROSHELL_CACHE', '1') != '0'
+        self._cache: AttrMap = {}
+        
+        # Per-thread read buffers, reused for every attribute read
+        self._local = threading.local()
+    
+    def _open_attr(self, name: str) -> int:
+        """Open an attribute file relative to the NeuroShell dirfd"""
+        self._check_open()
+        return os.open(name, os.O_RDONLY | os.O_NONBLOCK,
+                       dir_fd=self._handles.dirfd)
+    
+    def _check_open(self) -> None:
+        """Raise NeuroShellError if close() has been called"""
+        if self._handles.dirfd < 0:
+            raise NeuroShellError("NeuroShell interface is closed")
+    
+    def close(self) -> None:
+        """Close the held fds and shut down the read pool"""
+        self._finalizer()
+    
+    def __enter__(self) -> 'NeuroShell':
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    def invalidate(self) -> None:
+        """Drop cached attribute contents so the next read hits sysfs"""
+        self._cache.clear()
     
     def read_attr(self, attribute: str) -> Optional[str]:
         """
@@ -37,126 +179,288 @@ class NeuroShell:
         Returns:
             Content of the attribute as string, or None if not found
         """
-        attr_path = NEUROSHELL_PATH / attribute
+        raw = self.read_attr_bytes(attribute)
+        return None if raw is None else _text(raw)
+    
+    def read_attr_bytes(self, attribute: str) -> Optional[bytes]:
+        """
+        Read a NeuroShell sysfs attribute without decoding it
+        
+        Args:
+            attribute: Name of the attribute file
+            
+        Returns:
+            Stripped raw content of the attribute, or None if not found
+        """
+        if attribute in self._cache:
+            return self._cache[attribute]
+        raw = self._read_one(attribute)
+        if self._use_cache:
+            self._cache[attribute] = raw
+        return raw
+    
+    def _buffer(self) -> memoryview:
+        """Get the calling thread's one-page read buffer"""
+        buf = getattr(self._local, 'buf', None)
+        if buf is None:
+            buf = self._local.buf = memoryview(bytearray(ATTR_READ_SIZE))
+        return buf
+    
+    def _read_one(self, name: str) -> Optional[bytes]:
+        """
+        Read a single attribute with one preadv on its held fd
+        
+        Attributes that were not opened up front are opened on first use
+        and kept open afterwards. Stale fds left by a module reload are
+        reopened once before giving up.
+        
+        Args:
+            name: Name of the attribute file
+            
+        Returns:
+            Raw content of the attribute, or None if not found
+        """
+        buf = self._buffer()
+        # Reloading the module leaves held fds on dead sysfs nodes (ENODEV)
+        # and the dirfd on a removed directory (ENOENT), so reopen once.
+        # ENOENT on a live directory just means the attribute doesn't exist
+        # (e.g. the basic neuroshell.c module).
+        for retry in (False, True):
+            try:
+                n = os.preadv(self._held_fd(name, reopen_dir=retry), [buf], 0)
+            except OSError as e:
+                if e.errno not in (errno.ENODEV, errno.ENOENT):
+                    if isinstance(e, PermissionError):
+                        print(f"Permission denied reading {name}", file=sys.stderr)
+                        return None
+                    raise
+                if retry or not (e.errno == errno.ENODEV or self._dir_stale()):
+                    return None
+                self._drop_fd(name)
+            else:
+                return buf[:n].tobytes().strip()
+    
+    def _held_fd(self, name: str, reopen_dir: bool = False) -> int:
+        """
+        Get the held fd for an attribute, opening it on first use
+        
+        Args:
+            name: Name of the attribute file
+            reopen_dir: Reopen the NeuroShell directory before opening name
+            
+        Returns:
+            Open fd for the attribute
+        """
+        fds = self._handles.fds
+        fd = fds.get(name)
+        if fd is None:
+            # Every openat on the dirfd happens under the lock, so the
+            # dirfd can be swapped here safely
+            with self._fds_lock:
+                fd = fds.get(name)
+                if fd is None:
+                    if reopen_dir:
+                        self._reopen_dir()
+                    fd = fds[name] = self._open_attr(name)
+        return fd
+    
+    def _dir_stale(self) -> bool:
+        """Check whether the dirfd no longer refers to the live NeuroShell directory"""
         try:
-            return attr_path.read_text().strip()
+            held = os.fstat(self._handles.dirfd)
+        except OSError:
+            # Closed by a concurrent reopen
+            return True
+        try:
+            live = os.stat(NEUROSHELL_PATH)
         except FileNotFoundError:
-            return None
-        except PermissionError:
-            print(f"Permission denied reading {attribute}", file=sys.stderr)
-            return None
+            # Module unloaded; there is nothing to reopen
+            return False
+        return (held.st_nlink == 0 or
+                (held.st_dev, held.st_ino) != (live.st_dev, live.st_ino))
+    
+    def _reopen_dir(self) -> None:
+        """Replace the NeuroShell dirfd, called with _fds_lock held"""
+        self._check_open()
+        dirfd = os.open(NEUROSHELL_PATH, os.O_RDONLY | os.O_DIRECTORY)
+        os.close(self._handles.dirfd)
+        self._handles.dirfd = dirfd
+    
+    def _drop_fd(self, name: str) -> None:
+        """Close and forget the held fd for an attribute, if any"""
+        with self._fds_lock:
+            fd = self._handles.fds.pop(name, None)
+        if fd is not None:
+            os.close(fd)
+    
+    def _read_many(self, names: Iterable[str]) -> AttrMap:
+        """
+        Read several NeuroShell sysfs attributes in one pass
+        
+        Only attributes missing from the cache are read. The reads are
+        spread over a persistent thread pool so their time in the kernel
+        overlaps.
+        
+        Args:
+            names: Names of the attribute files
+            
+        Returns:
+            Dictionary mapping each name to its raw content, or None if not found
+        """
+        names = tuple(names)
+        missing = [name for name in names if name not in self._cache]
+        if len(missing) > 1:
+            self._check_open()
+            handles = self._handles
+            if handles.pool is None:
+                # Imported here: concurrent.futures pulls in logging, which
+                # single-attribute CLI runs never need
+                from concurrent.futures import ThreadPoolExecutor
+                handles.pool = ThreadPoolExecutor(max_workers=READ_WORKERS,
+                                                  thread_name_prefix='neuroshell')
+            fetched = dict(zip(missing, handles.pool.map(self._read_one, missing)))
+        else:
+            fetched = {name: self._read_one(name) for name in missing}
+        if not self._use_cache:
+            return fetched
+        self._cache.update(fetched)
+        return {name: self._cache[name] for name in names}
     
-    def parse_key_value(self, content: str) -> Dict[str, Any]:
+    def parse_key_value(self, content: Union[str, bytes]) -> Dict[str, Any]:
         """
         Parse key=value format content
         
         Args:
-            content: String with key=value pairs
+            content: String or raw bytes with key=value pairs
             
         Returns:
             Dictionary of parsed values
         """
-        result = {}
-        for line in content.split('\n'):
-            line = line.strip()
-            if '=' in line:
-                key, value = line.split('=', 1)
-                # Try to convert to int
-                try:
-                    result[key] = int(value)
-                except ValueError:
-                    result[key] = value
-        return result
+        if isinstance(content, str):
+            content = content.encode('utf-8')
+        return dict(_parse_key_value(content))
     
-    def get_cpu_info(self) -> Dict[str, Any]:
-        """Get CPU information"""
-        info = {}
+    def get_cpu_info(self, attrs: Optional[AttrMap] = None,
+                     detailed: bool = True) -> Dict[str, Any]:
+        """
+        Get CPU information
         
-        # Basic counts
-        cpu_count = self.read_attr('cpu_count')
-        if cpu_count:
-            info['online'] = int(cpu_count)
+        Args:
+            attrs: Attribute map from prefetch(), read on demand if omitted
+            detailed: Include the total, vendor details and topology from sysfs
+            
+        Returns:
+            Dictionary of CPU information
+        """
+        # Online count, same value as cpu_count without touching sysfs
+        info = {'online': os.sysconf('SC_NPROCESSORS_ONLN')}
+        if not detailed:
+            return info
+        
+        if attrs is None:
+            attrs = self._read_many(CATEGORY_ATTRS['cpu'])
         
-        cpu_total = self.read_attr('cpu_total')
+        # Total comes from sysfs: SC_NPROCESSORS_CONF counts present rather
+        # than possible CPUs on older glibc
+        cpu_total = attrs.get('cpu_total')
         if cpu_total:
             info['total'] = int(cpu_total)
         
         # Detailed info
-        cpu_info = self.read_attr('cpu_info')
+        cpu_info = attrs.get('cpu_info')
         if cpu_info:
             info.update(self.parse_key_value(cpu_info))
         
         # Topology
-        topology = self.read_attr('cpu_topology')
+        topology = attrs.get('cpu_topology')
         if topology:
-            info['topology'] = topology
+            info['topology'] = _text(topology)
         
         return info
     
-    def get_memory_info(self) -> Dict[str, Any]:
-        """Get memory information"""
-        info = {}
+    def get_memory_info(self, attrs: Optional[AttrMap] = None,
+                        detailed: bool = True) -> Dict[str, Any]:
+        """
+        Get memory information
+        
+        Args:
+            attrs: Attribute map from prefetch(), read on demand if omitted
+            detailed: Include the detailed breakdown from sysfs
+            
+        Returns:
+            Dictionary of memory information
+        """
+        # Total bytes, same value as mem_total_bytes without touching sysfs
+        total_bytes = os.sysconf('SC_PHYS_PAGES') * os.sysconf('SC_PAGE_SIZE')
+        info = {
+            'total_bytes': total_bytes,
+            'total_mb': total_bytes // (1024 * 1024),
+            'total_gb': total_bytes / (1024 * 1024 * 1024),
+        }
+        if not detailed:
+            return info
         
-        # Total bytes
-        mem_total = self.read_attr('mem_total_bytes')
-        if mem_total:
-            total_bytes = int(mem_total)
-            info['total_bytes'] = total_bytes
-            info['total_mb'] = total_bytes // (1024 * 1024)
-            info['total_gb'] = total_bytes / (1024 * 1024 * 1024)
+        if attrs is None:
+            attrs = self._read_many(CATEGORY_ATTRS['memory'])
         
         # Detailed info
-        mem_info = self.read_attr('mem_info')
+        mem_info = attrs.get('mem_info')
         if mem_info:
             info.update(self.parse_key_value(mem_info))
         
         return info
     
-    def get_numa_info(self) -> Dict[str, Any]:
+    def get_numa_info(self, attrs: Optional[AttrMap] = None) -> Dict[str, Any]:
         """Get NUMA information"""
+        if attrs is None:
+            attrs = self._read_many(CATEGORY_ATTRS['numa'])
         info = {}
         
         # Node count
-        numa_nodes = self.read_attr('numa_nodes')
+        numa_nodes = attrs.get('numa_nodes')
         if numa_nodes:
             info['nodes'] = int(numa_nodes)
         
         # Detailed info
-        numa_info = self.read_attr('numa_info')
+        numa_info = attrs.get('numa_info')
         if numa_info:
-            info['details'] = numa_info
+            info['details'] = _text(numa_info)
         
         return info
     
-    def get_gpu_info(self) -> Dict[str, Any]:
+    def get_gpu_info(self, attrs: Optional[AttrMap] = None) -> Dict[str, Any]:
         """Get GPU information"""
+        if attrs is None:
+            attrs = self._read_many(CATEGORY_ATTRS['gpu'])
         info = {}
         
         # Summary
-        gpu_info = self.read_attr('gpu_info')
+        gpu_info = attrs.get('gpu_info')
         if gpu_info:
             info.update(self.parse_key_value(gpu_info))
         
         # Details
-        gpu_details = self.read_attr('gpu_details')
+        gpu_details = attrs.get('gpu_details')
         if gpu_details:
-            info['details'] = gpu_details
+            info['details'] = _text(gpu_details)
         
         return info
     
-    def get_accelerator_info(self) -> Dict[str, Any]:
+    def get_accelerator_info(self, attrs: Optional[AttrMap] = None) -> Dict[str, Any]:
         """Get AI accelerator information"""
+        if attrs is None:
+            attrs = self._read_many(CATEGORY_ATTRS['accelerator'])
         info = {}
         
         # Count
-        accel_count = self.read_attr('accelerator_count')
+        accel_count = attrs.get('accelerator_count')
         if accel_count:
             info['count'] = int(accel_count)
         
         # Details
-        accel_details = self.read_attr('accelerator_details')
+        accel_details = attrs.get('accelerator_details')
         if accel_details:
-            info['details'] = accel_details
+            info['details'] = _text(accel_details)
         
         return info
     
@@ -164,14 +468,28 @@ class NeuroShell:
         """Get complete system summary"""
         return self.read_attr('system_summary') or "Summary not available"
     
+    def prefetch(self, categories: Iterable[str]) -> AttrMap:
+        """
+        Read every attribute needed by the given categories in one batch
+        
+        Args:
+            categories: Category names from CATEGORY_ATTRS
+            
+        Returns:
+            Attribute map to pass to the matching get_*_info methods
+        """
+        return self._read_many(
+            name for category in categories for name in CATEGORY_ATTRS[category])
+    
     def get_all_info(self) -> Dict[str, Any]:
         """Get all available information"""
+        attrs = self.prefetch(CATEGORY_ATTRS)
         return {
-            'cpu': self.get_cpu_info(),
-            'memory': self.get_memory_info(),
-            'numa': self.get_numa_info(),
-            'gpu': self.get_gpu_info(),
-            'accelerator': self.get_accelerator_info(),
+            'cpu': self.get_cpu_info(attrs),
+            'memory': self.get_memory_info(attrs),
+            'numa': self.get_numa_info(attrs),
+            'gpu': self.get_gpu_info(attrs),
+            'accelerator': self.get_accelerator_info(attrs),
         }
     
     def check_requirements(self, 
@@ -189,8 +507,8 @@ class NeuroShell:
         Returns:
             True if all requirements are met
         """
-        cpu_info = self.get_cpu_info()
-        mem_info = self.get_memory_info()
+        cpu_info = self.get_cpu_info(detailed=False)
+        mem_info = self.get_memory_info(detailed=False)
         gpu_info = self.get_gpu_info()
         
         checks = {
@@ -207,6 +525,58 @@ class NeuroShell:
         return all(checks.values())
 
 
+def write_json(info: Dict[str, Any], compact: bool = False) -> None:
+    """
+    Write info to stdout as JSON, using orjson when available
+    
+    Args:
+        info: Data to serialize
+        compact: Write a single line instead of indented JSON
+    """
+    try:
+        # Imported here to keep it off the non-JSON CLI paths
+        import orjson
+    except ImportError:
+        orjson = None
+    
+    data = None
+    if orjson is not None:
+        try:
+            data = orjson.dumps(info, option=None if compact else orjson.OPT_INDENT_2)
+        except TypeError:
+            # orjson rejects integers beyond 64 bits, which the parsers
+            # produce for long decimal values
+            pass
+    if data is None:
+        # Same UTF-8 bytes as orjson, fully encoded before anything is
+        # written so a non-UTF-8 stdout can't end up with half a document
+        if compact:
+            text = json.dumps(info, separators=(',', ':'), ensure_ascii=False)
+        else:
+            text = json.dumps(info, indent=2, ensure_ascii=False)
+        data = text.encode('utf-8')
+    sys.stdout.flush()
+    sys.stdout.buffer.write(data)
+    sys.stdout.buffer.write(b'\n')
+
+def write_text(info: Dict[str, Any]) -> None:
+    """Write info to stdout as human-readable text in a single write"""
+    parts = []
+    for category, data in info.items():
+        parts.append(f"\n=== {category.upper()} ===\n")
+        if isinstance(data, dict):
+            for key, value in data.items():
+                if not isinstance(value, str) or '\n' not in value:
+                    parts.append(f"  {key}: {value}\n")
+                else:
+                    parts.append(f"  {key}:\n")
+                    for line in value.split('\n'):
+                        parts.append(f"    {line}\n")
+        else:
+            parts.append(f"{data}\n")
+    sys.stdout.write(''.join(parts))
+
+
 def main():
     """Command-line interface"""
     import argparse
@@ -220,6 +590,7 @@ Examples:
   %(prog)s --cpu                  # Show CPU information
   %(prog)s --all --json           # Show all info in JSON format
   %(prog)s --check-requirements   # Check minimum requirements
+  %(prog)s --all --json --watch 5 # Poll all info every 5 seconds as NDJSON
         """
     )
     
@@ -239,6 +610,8 @@ Examples:
                        help='Display all information')
     parser.add_argument('--json', action='store_true',
                        help='Output in JSON format')
+    parser.add_argument('--watch', type=float, metavar='SECONDS',
+                       help='Re-read and display the selected information every SECONDS')
     parser.add_argument('--check-requirements', action='store_true',
                        help='Check if system meets minimum requirements')
     parser.add_argument('--min-cpus', type=int, default=4,
@@ -249,8 +622,22 @@ Examples:
                        help='Minimum GPUs required (default: 1)')
     
     args = parser.parse_args()
+    if args.watch is not None and not (math.isfinite(args.watch) and args.watch > 0):
+        parser.error('--watch interval must be a positive number')
+    if args.watch is not None and args.check_requirements:
+        parser.error('--watch cannot be combined with --check-requirements')
+    
+    if (args.json or args.all) and hasattr(sys.stdout, 'reconfigure'):
+        # Large outputs are written in one go and flushed explicitly
+        sys.stdout.reconfigure(line_buffering=False, write_through=False)
     
     try:
+        if args.watch is not None:
+            # Polling ends cleanly on Ctrl-C or SIGTERM, including during
+            # the first sample
+            for signum in (signal.SIGINT, signal.SIGTERM):
+                signal.signal(signum, lambda signum, frame: sys.exit(0))
+        
         ns = NeuroShell()
         
         if args.check_requirements:
@@ -261,46 +648,49 @@ Examples:
             )
             sys.exit(0 if result else 1)
         
-        if args.summary:
-            print(ns.get_system_summary())
-            return
-        
-        info = {}
+        dispatch = {
+            'cpu': ns.get_cpu_info,
+            'memory': ns.get_memory_info,
+            'numa': ns.get_numa_info,
+            'gpu': ns.get_gpu_info,
+            'accelerator': ns.get_accelerator_info,
+        }
+        requested = [category for category in dispatch
+                     if args.all or getattr(args, category)]
         
-        if args.all:
-            info = ns.get_all_info()
-        else:
-            if args.cpu:
-                info['cpu'] = ns.get_cpu_info()
-            if args.memory:
-                info['memory'] = ns.get_memory_info()
-            if args.numa:
-                info['numa'] = ns.get_numa_info()
-            if args.gpu:
-                info['gpu'] = ns.get_gpu_info()
-            if args.accelerator:
-                info['accelerator'] = ns.get_accelerator_info()
-        
-        if not info:
+        if args.summary or not requested:
             # Default: show summary
-            print(ns.get_system_summary())
-            return
-        
-        if args.json:
-            print(json.dumps(info, indent=2))
+            def emit() -> None:
+                print(ns.get_system_summary())
         else:
-            for category, data in info.items():
-                print(f"\n=== {category.upper()} ===")
-                if isinstance(data, dict):
-                    for key, value in data.items():
-                        if not isinstance(value, str) or '\n' not in value:
-                            print(f"  {key}: {value}")
-                        else:
-                            print(f"  {key}:")
-                            for line in value.split('\n'):
-                                print(f"    {line}")
+            def emit() -> None:
+                # Read the attributes of every requested category in one batch
+                attrs = ns.prefetch(requested)
+                info = {category: dispatch[category](attrs) for category in requested}
+                if args.json and args.watch is not None:
+                    # One timestamped document per line (NDJSON)
+                    write_json({'timestamp': time.time(), **info}, compact=True)
+                elif args.json:
+                    write_json(info)
                 else:
-                    print(data)
+                    write_text(info)
+        
+        try:
+            emit()
+            sys.stdout.flush()
+            
+            # Keep the same NeuroShell (and its open fds) across polls,
+            # only dropping cached contents between samples
+            while args.watch is not None:
+                time.sleep(args.watch)
+                ns.invalidate()
+                emit()
+                sys.stdout.flush()
+        except BrokenPipeError:
+            # The reader went away (e.g. piped into head); point stdout
+            # at /dev/null so the exit-time flush doesn't fail again
+            os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+            sys.exit(0)
     
     except NeuroShellError as e:
         print(f"Error: {e}", file=sys.stderr)
@@ -104,6 +104,37 @@ if command -v python3 &> /dev/null; then
     else
         echo -e "${YELLOW}! Python interface test failed (may be normal if module just loaded)${NC}"
     fi
+
+    # The optional C parser must agree with the pure Python one
+    echo "Testing C parser extension..."
+    if make python-ext > /dev/null 2>&1; then
+        if python3 - <<'EOF'
+import os
+import neuroshell
+from _neuroshell_parser import parse_kv
+
+samples = [
+    b"a=1\nb=-2\nc=--3\nd=-\ne=x=y\nnoeq\n f = 5 \n=z\nh=\n",
+    b"big=" + b"9" * 40 + b"\nneg=-" + b"1" * 19 + b"\n",
+]
+for name in sorted(os.listdir(neuroshell.NEUROSHELL_PATH)):
+    with open(os.path.join(neuroshell.NEUROSHELL_PATH, name), 'rb') as f:
+        samples.append(f.read())
+
+for content in samples:
+    expected = neuroshell._parse_kv_py(content)
+    actual = parse_kv(content)
+    assert list(actual.items()) == list(expected.items()), (content, actual, expected)
+    assert [type(v) for v in actual.values()] == [type(v) for v in expected.values()]
+EOF
+        then
+            echo -e "${GREEN}✓ C parser matches Python parser${NC}"
+        else
+            echo -e "${RED}✗ C parser differs from Python parser${NC}"
+        fi
+    else
+        echo -e "${YELLOW}! Could not build C parser, skipping parity test${NC}"
+    fi
 else
     echo -e "${YELLOW}! Python3 not found, skipping Python tests${NC}"
 fi